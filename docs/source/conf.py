@@ -2,10 +2,10 @@
 """Configuration file for the Sphinx documentation builder."""
 
 import datetime
+import functools
 import os
 import sys
-
-import sktime
+from importlib.metadata import version as _pkg_version
 
 # -- Path setup --------------------------------------------------------------
 
@@ -23,8 +23,44 @@ project = "sktime"
 project_copyright = f"2019 - {current_year} (BSD-3-Clause License)"
 author = "sktime developers"
 
+
+def _read_checkout_version():
+    """Read ``__version__`` from ``sktime/__init__.py`` of this checkout.
+
+    The file is parsed, not imported, to avoid importing sktime when loading
+    the config.
+
+    Returns
+    -------
+    version : str
+        The version string assigned to ``__version__``.
+    """
+    import ast
+
+    init_path = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)), "..", "..", "sktime", "__init__.py"
+    )
+    with open(init_path, encoding="utf-8") as file:
+        tree = ast.parse(file.read())
+    for node in tree.body:
+        if isinstance(node, ast.Assign) and any(
+            isinstance(target, ast.Name) and target.id == "__version__"
+            for target in node.targets
+        ):
+            return ast.literal_eval(node.value)
+    raise RuntimeError(f"__version__ not found in {init_path}")
+
+
 # The full version, including alpha/beta/rc tags
-CURRENT_VERSION = f"v{sktime.__version__}"
+# on readthedocs, sktime is installed from the checkout, so we read package metadata
+# otherwise, the checkout is first on the path, and may differ from the installed
+# sktime, so we read the version from the checkout, to match the documented code
+if ON_READTHEDOCS:
+    SKTIME_VERSION = _pkg_version("sktime")
+else:
+    SKTIME_VERSION = _read_checkout_version()
+
+CURRENT_VERSION = f"v{SKTIME_VERSION}"
 
 # If on readthedocs, and we're building the latest version, update tag to generate
 # correct links in notebooks
@@ -108,7 +144,15 @@ numpydoc_show_class_members = True
 # see https://github.com/numpy/numpydoc/issues/69
 numpydoc_class_members_toctree = False
 
-numpydoc_validation_checks = {"all"}
+# docstring validation is costly, so the full set of checks is only run on CI,
+# including readthedocs, which builds the published and pull request docs
+# local builds run a subset, and SKTIME_FAST_DOCS disables validation entirely
+if os.environ.get("SKTIME_FAST_DOCS"):
+    numpydoc_validation_checks = set()
+elif ON_READTHEDOCS or os.environ.get("CI"):
+    numpydoc_validation_checks = {"all"}
+else:
+    numpydoc_validation_checks = {"GL01", "GL02", "PR01", "PR02"}
 
 # generate autosummary even if no references
 autosummary_generate = True
@@ -160,6 +204,8 @@ def linkcode_resolve(domain, info):
         import inspect
         import os
 
+        import sktime
+
         fn = inspect.getsourcefile(obj)
         fn = os.path.relpath(fn, start=os.path.dirname(sktime.__file__))
         source, lineno = inspect.getsourcelines(obj)
@@ -298,51 +344,236 @@ texinfo_documents = [
 ]
 
 
+@functools.cache
+def _add_link(github_id_str):
+    """Return html link to the GitHub profile of a GitHub id, cached by id."""
+    link = f'<a href="https://www.github.com/{github_id_str}">{github_id_str}</a>'
+    return link
+
+
+def _process_author_info(author_info):
+    """Process author information from source code files.
+
+    Parameters
+    ----------
+    author_info : str or list of str
+        Author information string from source code files.
+
+    Returns
+    -------
+    author_info : str
+        Preprocessed author information.
+
+    Notes
+    -----
+    A list of author names is turned into a string.
+    Multiple author names will be separated by a comma,
+    with the final name always preceded by "&".
+    """
+    # lists are not hashable, so we convert to tuple to use the cache
+    if isinstance(author_info, list):
+        author_info = tuple(author_info)
+    return _process_author_info_cached(author_info)
+
+
+@functools.cache
+def _process_author_info_cached(author_info):
+    """Process author information, cached version of ``_process_author_info``.
+
+    Many estimators share authors and maintainers, so results are cached.
+
+    Parameters
+    ----------
+    author_info : str or tuple of str
+        Author information string from source code files.
+
+    Returns
+    -------
+    author_info : str
+        Preprocessed author information.
+    """
+    if isinstance(author_info, str) and author_info.lower() == "sktime developers":
+        link = '<a href="about/team.html">' "sktime developers</a>"
+        return link
+
+    if not isinstance(author_info, tuple):
+        author_info = [author_info]
+
+    author_info = [_add_link(author) for author in author_info]
+
+    if len(author_info) > 1:
+        return ", ".join(author_info[:-1]) + " & " + author_info[-1]
+    else:
+        return author_info[0]
+
+
+def _build_record(obj_name_class, tags_by_object_type):
+    """Build the overview table row for a single estimator.
+
+    Parameters
+    ----------
+    obj_name_class : tuple of (str, class)
+        Name and class of the estimator, as returned by ``all_estimators``.
+    tags_by_object_type : dict of str to list of str
+        Tags to retrieve, by object type, for the dropdown menu of the table.
+
+    Returns
+    -------
+    record : list
+        Row of the overview table, with entries in the order of the columns.
+    """
+    obj_name, obj_class = obj_name_class
+
+    # retrieve all tags at once, as each get_class_tag call walks the class hierarchy
+    all_tags = obj_class.get_class_tags()
+
+    author_tag = all_tags.get("authors", "sktime developers")
+    author_info = _process_author_info(author_tag)
+    maintainer_tag = all_tags.get("maintainers", "sktime developers")
+    maintainer_info = _process_author_info(maintainer_tag)
+
+    python_dependencies = all_tags.get("python_dependencies", [])
+    if isinstance(python_dependencies, list) and len(python_dependencies) == 1:
+        python_dependencies = python_dependencies[0]
+
+    object_types = all_tags.get("object_type", "object")
+    # the tag can contain multiple object types
+    # it is a str or a lis of str - we normalize to a list
+    if not isinstance(object_types, list):
+        object_types = [object_types]
+
+    # object types that are also in the dropdown menu, in order of the tag
+    # membership is checked against the dict keys directly, without building sets
+    obj_types_in_menu = [t for t in object_types if t in tags_by_object_type]
+
+    # we populate the tags for object types that are in the dropdown
+    # these will be selectable by checkboxes in the table
+    tags = {}
+    for object_type in obj_types_in_menu:
+        for tag in tags_by_object_type[object_type]:
+            tags[tag] = all_tags.get(tag, None)
+
+    # full path of the class, and path with the module file omitted
+    # e.g., sktime.forecasting.naive.NaiveForecaster and sktime.forecasting
+    module = obj_class.__module__
+    qualname = obj_class.__qualname__
+    module_parts = module.split(".")
+    import_path = ".".join(module_parts[:-1]) if len(module_parts) > 1 else module
+    clean_path = f"{import_path}.{qualname}" if import_path else qualname
+    modpath = f"{module}.{qualname}"
+    # adds html link reference
+    obj_name = (
+        """<a href='#'"""
+        f"""onclick="go2URL('api_reference/auto_generated/{clean_path}.html',"""
+        f"""'api_reference/auto_generated/{modpath}.html', event)">{obj_name}</a>"""
+    )
+
+    # determine the "main" object type
+    # this is the first in the list that also appears in the dropdown menu
+    # if obj_types_in_register is an empty list,
+    # in which case the object will appear only in the "ALL" table
+    if obj_types_in_menu == []:
+        first_obj_type_in_register = object_types[0]
+    else:
+        first_obj_type_in_register = obj_types_in_menu[0]
+
+    return [
+        obj_name,
+        first_obj_type_in_register,
+        author_info,
+        maintainer_info,
+        str(python_dependencies),
+        import_path,
+        tags,
+    ]
+
+
+def _write_if_changed(path, content):
+    """Write content to file at path, only if the file content differs.
+
+    Leaves the file untouched if unchanged, so its modification time is kept
+    and sphinx does not consider dependent pages outdated in incremental builds.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to write to.
+    content : bytes
+        Content to write to the file.
+    """
+    if os.path.exists(path):
+        with open(path, "rb") as file:
+            if file.read() == content:
+                return
+
+    with open(path, "wb") as file:
+        file.write(content)
+
+
+def _max_mtime(path):
+    """Return the latest modification time of python files under a directory.
+
+    Recurses with ``os.scandir``, which is faster than ``Path.rglob``
+    since file metadata is obtained from the directory listing where possible.
+
+    Parameters
+    ----------
+    path : str
+        Path of the directory to search.
+
+    Returns
+    -------
+    mtime : float
+        Latest modification time of ``.py`` files under ``path``, 0 if none.
+    """
+    mtime = 0
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                mtime = max(mtime, _max_mtime(entry.path))
+            elif entry.name.endswith(".py"):
+                mtime = max(mtime, entry.stat().st_mtime)
+    return mtime
+
+
+def _src_mtime():
+    """Return the latest modification time of the estimator overview sources.
+
+    Compared against the stamp file to decide whether the overview is outdated.
+
+    Returns
+    -------
+    mtime : float
+        Latest modification time of python files in the sktime package,
+        and of this configuration file.
+    """
+    from importlib.util import find_spec
+
+    sktime_dir = os.path.dirname(find_spec("sktime").origin)
+    return max(_max_mtime(sktime_dir), os.path.getmtime(__file__))
+
+
 def _make_estimator_overview(app):
     """Make estimator overview table."""
+    from importlib.util import find_spec
+    from pathlib import Path
+
+    table_path = os.path.join(app.srcdir, "_static", "table_all.html")
+    json_path = os.path.join(app.srcdir, "_static", "estimator_overview_db.json")
+    # stamp file, its modification time is the last time the overview was made
+    stamp_path = Path(app.doctreedir) / "estimator_overview.stamp"
+
+    # skip the overview, including the import of all estimators,
+    # if neither sktime sources nor this file changed since it was last made
+    outputs_exist = os.path.exists(table_path) and os.path.exists(json_path)
+    if outputs_exist and stamp_path.exists():
+        if stamp_path.stat().st_mtime > _src_mtime():
+            return
+
     import pandas as pd
 
     from sktime.registry import all_estimators
 
-    def _process_author_info(author_info):
-        """Process author information from source code files.
-
-        Parameters
-        ----------
-        author_info : str
-            Author information string from source code files.
-
-        Returns
-        -------
-        author_info : str
-            Preprocessed author information.
-
-        Notes
-        -----
-        A list of author names is turned into a string.
-        Multiple author names will be separated by a comma,
-        with the final name always preceded by "&".
-        """
-        if isinstance(author_info, str) and author_info.lower() == "sktime developers":
-            link = '<a href="about/team.html">' "sktime developers</a>"
-            return link
-
-        if not isinstance(author_info, list):
-            author_info = [author_info]
-
-        def _add_link(github_id_str):
-            link = (
-                f'<a href="https://www.github.com/{github_id_str}">{github_id_str}</a>'
-            )
-            return link
-
-        author_info = [_add_link(author) for author in author_info]
-
-        if len(author_info) > 1:
-            return ", ".join(author_info[:-1]) + " & " + author_info[-1]
-        else:
-            return author_info[0]
-
     # hard-coded for better user experience
     tags_by_object_type = {
         "forecaster": [
@@ -486,80 +717,55 @@ def _make_estimator_overview(app):
         "Tags",
     ]
 
-    records = []
-
-    for obj_name, obj_class in all_estimators():
-        author_tag = obj_class.get_class_tag("authors", "sktime developers")
-        author_info = _process_author_info(author_tag)
-        maintainer_tag = obj_class.get_class_tag("maintainers", "sktime developers")
-        maintainer_info = _process_author_info(maintainer_tag)
-
-        python_dependencies = obj_class.get_class_tag("python_dependencies", [])
-        if isinstance(python_dependencies, list) and len(python_dependencies) == 1:
-            python_dependencies = python_dependencies[0]
-
-        object_types = obj_class.get_class_tag("object_type", "object")
-        # the tag can contain multiple object types
-        # it is a str or a lis of str - we normalize to a list
-        if not isinstance(object_types, list):
-            object_types = [object_types]
-
-        # set of object types that are also in the dropdown menu
-        obj_types_in_menu = list(set(object_types) & set(tags_by_object_type.keys()))
-
-        # we populate the tags for object types that are in the dropdown
-        # these will be selectable by checkboxes in the table
-        tags = {}
-        for object_type in obj_types_in_menu:
-            for tag in tags_by_object_type[object_type]:
-                tags[tag] = obj_class.get_class_tag(tag, None)
-
-        # includes part of class string
-        modpath = str(obj_class)[8:-2]
-        path_parts = modpath.split(".")
-        del path_parts[-2]
-        clean_path = ".".join(path_parts)
-        import_path = ".".join(path_parts[:-1])
-        # adds html link reference
-        obj_name = (
-            """<a href='#'"""
-            f"""onclick="go2URL('api_reference/auto_generated/{clean_path}.html',"""
-            f"""'api_reference/auto_generated/{modpath}.html', event)">{obj_name}</a>"""
-        )
+    estimators = all_estimators()
 
-        # determine the "main" object type
-        # this is the first in the list that also appears in the dropdown menu
-        # if obj_types_in_register is an empty list,
-        # in which case the object will appear only in the "ALL" table
-        if obj_types_in_menu == []:
-            first_obj_type_in_register = object_types[0]
-        else:
-            first_obj_type_in_register = obj_types_in_menu[0]
-
-        records.append(
-            [
-                obj_name,
-                first_obj_type_in_register,
-                author_info,
-                maintainer_info,
-                str(python_dependencies),
-                import_path,
-                tags,
-            ]
-        )
+    records = [
+        _build_record(obj_name_class, tags_by_object_type)
+        for obj_name_class in estimators
+    ]
+
+    # transpose rows into columns, so pandas allocates each column directly
+    # instead of inferring dtypes row by row from a list of lists
+    columns = {
+        colname: [record[i] for record in records] for i, colname in enumerate(COLNAMES)
+    }
+
+    # text columns are stored as arrow strings if pyarrow is available,
+    # contiguous utf-8 storage avoids python object access when serializing
+    if find_spec("pyarrow") is not None:
+        string_dtype = pd.StringDtype("pyarrow")
+        columns = {
+            colname: pd.array(values, dtype=string_dtype)
+            if colname != "Tags"
+            else values
+            for colname, values in columns.items()
+        }
+
+    df = pd.DataFrame(columns)
 
-    df = pd.DataFrame(records, columns=COLNAMES)
     # with open("estimator_overview_table.md", "w") as file:
     #     df.to_markdown(file, index=False)
 
-    with open("_static/table_all.html", "w") as file:
-        df[
-            ["Class Name", "Estimator Type", "Authors", "Maintainers", "Dependencies"]
-        ].to_html(file, classes="pre-rendered", index=False, border=0, escape=False)
+    table_html = df[
+        ["Class Name", "Estimator Type", "Authors", "Maintainers", "Dependencies"]
+    ].to_html(classes="pre-rendered", index=False, border=0, escape=False)
+    _write_if_changed(table_path, table_html.encode("utf-8"))
 
-    with open("_static/estimator_overview_db.json", "w") as file:
-        df.to_json(file, orient="records")
-    # pass
+    # orjson encodes much faster than pandas, if available
+    try:
+        import orjson
+
+        db_json = orjson.dumps(
+            df.to_dict(orient="records"), option=orjson.OPT_SERIALIZE_NUMPY
+        )
+    except (ImportError, TypeError):
+        # TypeError is raised by orjson for types it cannot serialize
+        db_json = df.to_json(orient="records").encode("utf-8")
+    _write_if_changed(json_path, db_json)
+
+    # the outputs are up to date, refresh the stamp
+    stamp_path.parent.mkdir(parents=True, exist_ok=True)
+    stamp_path.touch()
 
 
 def setup(app):
@@ -4,7 +4,10 @@ import numpy as np
 import pandas as pd
 
 from sktime.performance_metrics.detection._base import BaseDetectionMetric
-from sktime.performance_metrics.detection.utils import _find_closest_elements
+from sktime.performance_metrics.detection.utils import (
+    _find_closest_elements,
+    _sort_if_unsorted,
+)
 
 
 class DirectedChamfer(BaseDetectionMetric):
@@ -73,21 +76,22 @@ class DirectedChamfer(BaseDetectionMetric):
         loss : float
             Calculated metric.
         """
-        y_true_ilocs = y_true.ilocs
-        y_pred_ilocs = y_pred.ilocs
+        y_true_ilocs = y_true.ilocs.to_numpy()
+        y_pred_ilocs = y_pred.ilocs.to_numpy()
 
         if X is not None and not isinstance(X.index, pd.RangeIndex):
-            y_true_locs = X.index[y_true_ilocs]
-            y_pred_locs = X.index[y_pred_ilocs]
+            y_true_locs = X.index[y_true_ilocs].to_numpy()
+            y_pred_locs = X.index[y_pred_ilocs].to_numpy()
         else:
             y_true_locs = y_true_ilocs
             y_pred_locs = y_pred_ilocs
 
-        y_true_locs = y_true_locs.to_numpy()
-        y_pred_locs = y_pred_locs.to_numpy()
+        # closest element search requires sorted inputs, sorting is done
+        # on the primitive dtype, and skipped if the locations are already sorted
+        y_true_locs = _sort_if_unsorted(y_true_locs)
+        y_pred_locs = _sort_if_unsorted(y_pred_locs)
 
         y_true_closest = _find_closest_elements(y_pred_locs, y_true_locs)
-        y_true_closest = np.array(y_true_closest)
 
         distance = np.sum(np.abs(y_true_closest - y_pred_locs))
 
@@ -0,0 +1,95 @@
+"""Tests for the closest element utility of detection metrics."""
+
+import numpy as np
+import pytest
+
+from sktime.performance_metrics.detection.utils import (
+    _find_closest_elements,
+    _sort_if_unsorted,
+)
+from sktime.utils.dependencies import _check_soft_dependencies
+
+
+def _brute_force_closest(a, b):
+    """Find closest elements by brute force, first closest in case of ties."""
+    b = np.asarray(b)
+    return [b[np.argmin(np.abs(b - x))] for x in a]
+
+
+def _set_numba(monkeypatch, use_numba):
+    """Force the numba or the numpy path of _find_closest_elements."""
+    from sktime.performance_metrics.detection.utils import _closest
+
+    if use_numba and not _check_soft_dependencies("numba", severity="none"):
+        pytest.skip("skip test if required soft dependency not available")
+    monkeypatch.setattr(_closest, "_NUMBA_AVAILABLE", use_numba)
+
+
+def test_find_closest_elements():
+    """Test _find_closest_elements against brute force search."""
+    a = [1, 3, 5, 7, 42]
+    b = [2, 3.1, 3.2, 4, 6]
+
+    closest = _find_closest_elements(a, b)
+
+    assert len(closest) == len(a)
+    np.testing.assert_array_equal(closest, _brute_force_closest(a, b))
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_find_closest_elements_duplicates_ties(monkeypatch, use_numba):
+    """Test numpy and numba paths against brute force, with duplicates and ties."""
+    _set_numba(monkeypatch, use_numba)
+
+    # ties at 3 (between 2 and 4), duplicates in both a and b
+    a = np.array([0, 1, 3, 3, 5, 5, 7, 42])
+    b = np.array([1, 1, 2, 4, 6, 6])
+
+    closest = _find_closest_elements(a, b)
+    np.testing.assert_array_equal(closest, _brute_force_closest(a, b))
+
+    a_float = a + 0.5
+    closest_float = _find_closest_elements(a_float, b)
+    np.testing.assert_array_equal(closest_float, _brute_force_closest(a_float, b))
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_find_closest_elements_large_int(monkeypatch, use_numba):
+    """Test that large int64 locations are matched exactly, without float casting."""
+    _set_numba(monkeypatch, use_numba)
+
+    a = np.array([2**62 + 1, 2**62 + 3], dtype=np.int64)
+    b = np.array([2**62, 2**62 + 3], dtype=np.int64)
+
+    closest = _find_closest_elements(a, b)
+    assert closest.dtype == np.int64
+    np.testing.assert_array_equal(closest, [2**62, 2**62 + 3])
+
+
+@pytest.mark.parametrize("use_numba", [False, True])
+def test_find_closest_elements_unsigned(monkeypatch, use_numba):
+    """Test that unsigned integer locations do not wrap around in distances."""
+    _set_numba(monkeypatch, use_numba)
+
+    a = np.array([3, 4], dtype=np.uint64)
+    b = np.array([1, 5], dtype=np.uint64)
+
+    closest = _find_closest_elements(a, b)
+    np.testing.assert_array_equal(closest, [1, 5])
+
+
+def test_find_closest_elements_empty():
+    """Test _find_closest_elements with empty first argument."""
+    closest = _find_closest_elements([], [1, 2, 3])
+    assert len(closest) == 0
+
+
+def test_sort_if_unsorted():
+    """Test that _sort_if_unsorted sorts, and returns sorted input as is."""
+    a_sorted = np.array([1, 2, 2, 5])
+    assert _sort_if_unsorted(a_sorted) is a_sorted
+
+    a_unsorted = np.array([5, 1, 2, 2])
+    np.testing.assert_array_equal(_sort_if_unsorted(a_unsorted), a_sorted)
+    # input is not modified
+    np.testing.assert_array_equal(a_unsorted, [5, 1, 2, 2])
@@ -1,5 +1,8 @@
 """Utilities for detection metrics."""
 
-from sktime.performance_metrics.detection.utils._closest import _find_closest_elements
+from sktime.performance_metrics.detection.utils._closest import (
+    _find_closest_elements,
+    _sort_if_unsorted,
+)
 
-__all__ = ["_find_closest_elements"]
+__all__ = ["_find_closest_elements", "_sort_if_unsorted"]
@@ -1,5 +1,12 @@
 """Utility to find all closest elements in sorted list b to sorted list a."""
 
+import numpy as np
+
+from sktime.utils.dependencies import _check_soft_dependencies
+
+# checked once on import, as the check is more costly than the search itself
+_NUMBA_AVAILABLE = _check_soft_dependencies("numba", severity="none")
+
 
 def _find_closest_elements(a, b):
     """Find the closest element in b for each element in a.
@@ -13,32 +20,74 @@ def _find_closest_elements(a, b):
 
     Returns
     -------
-    closest : list, same length as a
-        a list of closest elements in ``b`` for each element in ``a``.
+    closest : 1D np.ndarray, same length as a
+        array of closest elements in ``b`` for each element in ``a``.
         In case of ties, the first closest element is chosen.
 
     Examples
     --------
+    >>> from sktime.performance_metrics.detection.utils import _find_closest_elements
     >>> a = [1, 3, 5]
     >>> b = [2, 3.1, 3.2, 4, 6]
-    >>> pointer = DirectedHausdorff()._find_closest_elements(a, b)
+    >>> closest = _find_closest_elements(a, b)
     """
-    # Pointers for traversing A and B
-    i, j = 0, 0
-    n, m = len(a), len(b)
+    a = np.asarray(a)
+    b = np.asarray(b)
+
+    # unsigned integers would wrap around when subtracted to compute distances
+    if np.issubdtype(a.dtype, np.unsignedinteger):
+        a = a.astype(np.int64)
+    if np.issubdtype(b.dtype, np.unsignedinteger):
+        b = b.astype(np.int64)
+
+    if len(a) == 0:
+        return b[:0]
+
+    # if numba is present, use the compiled linear sweep for signed integer
+    # and float inputs, numba is imported only here to keep the import light
+    # the kernel is specialized on the common dtype, so integers stay exact
+    dtype = np.result_type(a, b)
+    is_signed_numeric = np.issubdtype(dtype, np.signedinteger) or np.issubdtype(
+        dtype, np.floating
+    )
+    if len(b) > 0 and is_signed_numeric and _NUMBA_AVAILABLE:
+        from sktime.performance_metrics.detection.utils._closest_numba import (
+            _find_closest_elements_numba,
+        )
+
+        a_common = np.ascontiguousarray(a, dtype=dtype)
+        b_common = np.ascontiguousarray(b, dtype=dtype)
+        return _find_closest_elements_numba(a_common, b_common)
+
+    # index of first element in b that is not smaller than a[i]
+    right = np.searchsorted(b, a, side="left")
+    # candidates are b[right] and its predecessor b[right - 1], clipped to bounds
+    cand = np.minimum(right, len(b) - 1)
+    prev = np.maximum(right - 1, 0)
 
-    # List to store the result
-    result = []
+    # prefer the predecessor in case of ties, i.e., the first closest element
+    use_prev = np.abs(b[prev] - a) <= np.abs(b[cand] - a)
+    closest = np.where(use_prev, b[prev], b[cand])
 
-    while i < n:
-        # Move pointer j in b to get the closest value to a[i]
-        while j + 1 < m and abs(b[j + 1] - a[i]) < abs(b[j] - a[i]):
-            j += 1
+    return closest
 
-        # Append the closest value in b for a[i]
-        result.append(b[j])
 
-        # Move to the next element in a
-        i += 1
+def _sort_if_unsorted(a):
+    """Return a sorted version of a 1D numpy array, skipping the sort if sorted.
 
-    return result
+    Detected and true event locations are almost always already sorted,
+    in which case the linear check avoids the sort and the copy.
+
+    Parameters
+    ----------
+    a : 1D np.ndarray
+        array of elements, not modified by this function.
+
+    Returns
+    -------
+    a_sorted : 1D np.ndarray
+        ``a`` itself if already sorted, otherwise a sorted copy of ``a``.
+    """
+    if len(a) < 2 or np.all(a[:-1] <= a[1:]):
+        return a
+    return np.sort(a)
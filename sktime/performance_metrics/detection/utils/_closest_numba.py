@@ -0,0 +1,41 @@
+"""Numba kernel to find all closest elements in sorted array b to sorted array a."""
+
+import numpy as np
+
+from sktime.utils.numba.njit import njit
+
+
+@njit(cache=True, boundscheck=False)
+def _find_closest_elements_numba(a, b):
+    """Find the closest element in b for each element in a, compiled sweep.
+
+    Parameters
+    ----------
+    a : 1D np.ndarray of signed integer or float dtype
+        An ordered (sorted) array of elements.
+    b : 1D np.ndarray of same dtype as a, non-empty
+        Another ordered (sorted) array of elements.
+
+    Returns
+    -------
+    closest : 1D np.ndarray of same dtype as a, same length as a
+        array of closest elements in ``b`` for each element in ``a``.
+        In case of ties, the first closest element is chosen.
+    """
+    n = a.shape[0]
+    m = b.shape[0]
+    closest = np.empty_like(a)
+
+    j = 0
+    for i in range(n):
+        a_i = a[i]
+        # move j to the last element in b smaller than a[i], if any
+        while j + 1 < m and b[j + 1] < a_i:
+            j += 1
+        # successor b[j + 1] is chosen only if strictly closer
+        if j + 1 < m and abs(b[j + 1] - a_i) < abs(b[j] - a_i):
+            closest[i] = b[j + 1]
+        else:
+            closest[i] = b[j]
+
+    return closest